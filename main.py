@@ -5,13 +5,21 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import os
 import sys
-from typing import Dict, List, Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional
 
 import requests
 
 import rdw_client as rdw
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 def show_columns() -> None:
     print("Available columns (Dutch -> English):")
@@ -19,6 +27,46 @@ def show_columns() -> None:
         print(f"- {source} -> {target}")
 
 
+def print_preview(records: List[Dict[str, object]]) -> None:
+    if orjson is not None:
+        sys.stdout.write(orjson.dumps(records, option=orjson.OPT_INDENT_2).decode())
+        sys.stdout.write("\n")
+    else:
+        print(json.dumps(records, ensure_ascii=False, indent=2))
+
+
+def iter_translated(
+    raw_records: Iterable[Dict[str, object]], page_size: int, workers: int
+) -> Iterator[Dict[str, object]]:
+    batches = rdw.iter_batches(raw_records, page_size)
+    if workers == 1:
+        for batch in batches:
+            yield from rdw.translate_records(batch)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Keep a bounded window in flight and drain it in submission order
+        # so rows come out in the order they were downloaded
+        pending = deque()
+        for batch in batches:
+            pending.append(executor.submit(rdw.translate_records, batch))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def non_negative_int(raw: str) -> int:
+    try:
+        value = int(raw)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer, got {raw!r}") from None
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {value}")
+    return value
+
+
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description=(
@@ -35,8 +83,30 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default=rdw.DEFAULT_PAGE_SIZE,
         help="Rows fetched per API request (default: %(default)s).",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Pages downloaded in parallel; values above 1 use aiohttp (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=non_negative_int,
+        default=1,
+        help="Processes used to translate downloaded pages; 0 uses one per CPU (default: %(default)s).",
+    )
     parser.add_argument("--excel-path", help="Path to save results as an .xlsx file.")
     parser.add_argument("--csv-path", help="Path to save results as CSV for Excel/BI tools.")
+    parser.add_argument("--parquet-path", help="Path to save results as a zstd-compressed Parquet file.")
+    parser.add_argument(
+        "--fast-csv",
+        action="store_true",
+        help="Write --csv-path in one pass with pyarrow instead of streaming rows.",
+    )
+    parser.add_argument(
+        "--columns",
+        help="Comma-separated English column names to download and export (default: all).",
+    )
     parser.add_argument("--show-columns", action="store_true", help="List available columns and exit.")
     parser.add_argument(
         "--app-token",
@@ -64,45 +134,108 @@ def main(argv: Optional[List[str]] = None) -> int:
         show_columns()
         return 0
 
-    if not args.excel_path and not args.csv_path and args.preview == 0:
-        print("No output selected. Enable --preview, --excel-path, or --csv-path.", file=sys.stderr)
+    if not args.excel_path and not args.csv_path and not args.parquet_path and args.preview == 0:
+        print(
+            "No output selected. Enable --preview, --excel-path, --csv-path, or --parquet-path.",
+            file=sys.stderr,
+        )
+        return 2
+
+    requested_columns = None
+    if args.columns is not None:
+        requested_columns = [column.strip() for column in args.columns.split(",") if column.strip()]
+        if not requested_columns:
+            print("--columns needs at least one column name. Use --show-columns to list them.", file=sys.stderr)
+            return 2
+    try:
+        fieldnames = rdw.resolve_columns(requested_columns)
+    except ValueError as exc:
+        print(f"{exc}. Use --show-columns to list them.", file=sys.stderr)
         return 2
 
     filters = rdw.build_filters(args.category, args.license_plate)
     app_token = rdw.resolve_app_token(args.app_token)
 
-    translated_for_excel: List[Dict[str, object]] = []
+    excel_writer = None
+    if args.excel_path:
+        try:
+            excel_writer = rdw.ExcelWriter(args.excel_path, fieldnames)
+        except RuntimeError as exc:
+            print("Excel export failed:", exc, file=sys.stderr)
+            return 1
+
+    fast_csv = bool(args.csv_path and args.fast_csv)
+    columns_buffer = None
+    if args.parquet_path or fast_csv:
+        columns_buffer = rdw.SoABuffer(fieldnames)
     csv_writer = None
     csv_handle = None
-    if args.csv_path:
-        csv_handle = open(args.csv_path, "w", newline="", encoding="utf-8")
-        csv_writer = csv.DictWriter(csv_handle, fieldnames=rdw.CSV_FIELDNAMES)
-        csv_writer.writeheader()
-    preview_count = 0
+    csv_batch: List[List[object]] = []
+    if args.csv_path and not fast_csv:
+        csv_handle = open(
+            args.csv_path, "w", newline="", encoding="utf-8", buffering=rdw.CSV_BUFFER_SIZE
+        )
+        csv_writer = csv.writer(csv_handle)
+        csv_writer.writerow(fieldnames)
+    preview_buffer: List[Dict[str, object]] = []
     total = 0
 
     try:
-        raw_records = rdw.fetch_rdw_data(
+        fetch = rdw.fetch_rdw_data
+        fetch_options = {}
+        if requested_columns:
+            fetch_options["select_columns"] = fieldnames
+        if args.concurrency > 1:
+            fetch = rdw.fetch_rdw_data_concurrent
+            fetch_options["concurrency"] = args.concurrency
+        raw_records = fetch(
             limit=args.limit,
             page_size=args.page_size,
             filters=filters,
             app_token=app_token,
             timeout=args.timeout,
+            **fetch_options,
         )
 
-        for record in raw_records:
-            translated = rdw.translate_record(record)
+        # Resolve everything the per-row body touches once, outside the loop
+        preview_limit = args.preview
+        # Keyset paging may add the plate to $select; keep it out of the preview
+        preview_fields = frozenset(fieldnames) if requested_columns else None
+        add_preview = preview_buffer.append
+        add_excel_row = excel_writer.append if excel_writer is not None else None
+        add_columns = columns_buffer.add if columns_buffer is not None else None
+        add_csv_row = csv_batch.append
+        csv_batch_size = rdw.CSV_BATCH_SIZE
+
+        for translated in iter_translated(raw_records, args.page_size, args.workers):
             total += 1
 
-            if args.preview and preview_count < args.preview:
-                print(json.dumps(translated, ensure_ascii=False, indent=2))
-                preview_count += 1
+            if total <= preview_limit:
+                if preview_fields is not None:
+                    add_preview({key: value for key, value in translated.items() if key in preview_fields})
+                else:
+                    add_preview(translated)
 
-            if args.excel_path:
-                translated_for_excel.append(translated)
+            if add_excel_row is not None:
+                add_excel_row(translated)
+
+            if add_columns is not None:
+                add_columns(translated)
 
             if csv_writer is not None:
-                csv_writer.writerow({field: translated.get(field, "") for field in rdw.CSV_FIELDNAMES})
+                get = translated.get
+                add_csv_row([get(field, "") for field in fieldnames])
+                if len(csv_batch) >= csv_batch_size:
+                    csv_writer.writerows(csv_batch)
+                    csv_batch.clear()
+                    # Keep whatever was downloaded if a later page fails
+                    csv_handle.flush()
+
+        if csv_writer is not None and csv_batch:
+            csv_writer.writerows(csv_batch)
+
+        if preview_buffer:
+            print_preview(preview_buffer)
 
     except requests.HTTPError as exc:
         print("HTTP error while fetching data:", exc, file=sys.stderr)
@@ -112,24 +245,42 @@ def main(argv: Optional[List[str]] = None) -> int:
     except requests.RequestException as exc:
         print("Request failed:", exc, file=sys.stderr)
         return 1
+    except RuntimeError as exc:
+        print("Export failed:", exc, file=sys.stderr)
+        return 1
     finally:
         if csv_handle is not None:
             csv_handle.close()
 
-    if args.excel_path and translated_for_excel:
+    if excel_writer is not None and excel_writer.rows:
         try:
-            rdw.export_to_excel(translated_for_excel, args.excel_path)
+            excel_writer.save()
             print(f"Excel export written to {args.excel_path}")
         except Exception as exc:  # pragma: no cover
             print("Excel export failed:", exc, file=sys.stderr)
             return 1
 
-    if args.csv_path and csv_writer is not None:
+    if args.parquet_path and columns_buffer:
+        try:
+            rdw.export_to_parquet(columns_buffer, args.parquet_path)
+            print(f"Parquet export written to {args.parquet_path}")
+        except Exception as exc:  # pragma: no cover
+            print("Parquet export failed:", exc, file=sys.stderr)
+            return 1
+
+    if fast_csv:
+        try:
+            rdw.export_columns_to_csv(columns_buffer, args.csv_path)
+        except Exception as exc:  # pragma: no cover
+            print("CSV export failed:", exc, file=sys.stderr)
+            return 1
+
+    if args.csv_path and (csv_writer is not None or fast_csv):
         print(f"CSV export written to {args.csv_path}")
 
     print(f"Total records retrieved: {total}")
     if args.preview:
-        print(f"Previewed records: {preview_count}")
+        print(f"Previewed records: {len(preview_buffer)}")
     if args.limit is None and args.page_size == rdw.DEFAULT_PAGE_SIZE:
         print("Tip: use --limit to control dataset size or --page-size to tune download batches.")
 
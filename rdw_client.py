@@ -1,22 +1,64 @@
 """Shared tools for working with RDW vehicle data."""
 from __future__ import annotations
 
-from typing import Dict, Iterator, List, Optional
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 
+import asyncio
+import json
 import os
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
-    import pandas as pd
+    import aiohttp
 except ImportError:  # pragma: no cover
-    pd = None  # type: ignore
+    aiohttp = None  # type: ignore
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore
+
+try:
+    import openpyxl
+except ImportError:  # pragma: no cover
+    openpyxl = None  # type: ignore
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None  # type: ignore
 
 BASE_URL = "https://opendata.rdw.nl/resource/m9d7-ebf2.json"
 DEFAULT_PAGE_SIZE = 10000
 EXCEL_MAX_ROWS = 1_048_576
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+CONNECT_TIMEOUT = 3.05
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+# False once we know HTTP/2 is unavailable (httpx or h2 missing)
+_HTTP2_CLIENT: object = None
+_HTTP2_LOCK = threading.Lock()
 
-COLUMN_TRANSLATIONS: Dict[str, str] = {
+_COLUMN_TRANSLATIONS: Dict[str, str] = {
     "kenteken": "license_plate",
     "voertuigsoort": "vehicle_type",
     "merk": "make",
@@ -116,11 +158,20 @@ COLUMN_TRANSLATIONS: Dict[str, str] = {
     "api_gekentekende_voertuigen_carrosserie_specifiek": "api_bodywork_specific_endpoint",
     "api_gekentekende_voertuigen_voertuigklasse": "api_vehicle_class_endpoint",
 }
+COLUMN_TRANSLATIONS: Mapping[str, str] = MappingProxyType(_COLUMN_TRANSLATIONS)
 
-CSV_FIELDNAMES = sorted(COLUMN_TRANSLATIONS.values())
+_COL_GET = _COLUMN_TRANSLATIONS.get
+
+CSV_FIELDNAMES: Tuple[str, ...] = tuple(sorted(COLUMN_TRANSLATIONS.values()))
+CSV_FIELDNAMES_INDEX: Mapping[str, int] = MappingProxyType(
+    {name: index for index, name in enumerate(CSV_FIELDNAMES)}
+)
+_DUTCH_COLUMNS = {english: dutch for dutch, english in COLUMN_TRANSLATIONS.items()}
+CSV_BATCH_SIZE = 4096
+CSV_BUFFER_SIZE = 1 << 20
 
 # Vehicle category translations (Dutch -> English)
-CATEGORY_TRANSLATIONS: Dict[str, str] = {
+_CATEGORY_TRANSLATIONS: Dict[str, str] = {
     "Aanhangwagen": "Trailer",
     "Autonome aanhangwagen": "Autonomous trailer", 
     "Bedrijfsauto": "Commercial vehicle",
@@ -137,74 +188,151 @@ CATEGORY_TRANSLATIONS: Dict[str, str] = {
     "Oplegger": "Semi-trailer",
     "Personenauto": "Passenger car"
 }
+CATEGORY_TRANSLATIONS: Mapping[str, str] = MappingProxyType(_CATEGORY_TRANSLATIONS)
+
+
+# Dutch -> English value translations applied to every translated cell
+_VALUE_TRANSLATIONS: Dict[str, str] = {
+    "Ja": "Yes",
+    "Nee": "No",
+    "ja": "Yes",
+    "nee": "No",
+    "JA": "Yes",
+    "NEE": "No",
+    # Common Dutch phrases
+    "Niet geregistreerd": "Not registered",
+    "Niet van toepassing": "Not applicable",
+    "Onbekend": "Unknown",
+    "Leeg": "Empty",
+    "Niet beschikbaar": "Not available",
+    "Niet opgegeven": "Not specified",
+    "Niet bekend": "Not known",
+    "Niet ingevuld": "Not filled in",
+    "Niet vermeld": "Not mentioned",
+    "Niet opgenomen": "Not included",
+    # Vehicle types
+    **CATEGORY_TRANSLATIONS,
+}
+
+
+# Columns holding plain measurements/counts; their values never need translating
+_NUMERIC_COLUMNS = frozenset({
+    "bruto_bpm",
+    "aantal_zitplaatsen",
+    "aantal_cilinders",
+    "cilinderinhoud",
+    "massa_ledig_voertuig",
+    "toegestane_maximum_massa_voertuig",
+    "massa_rijklaar",
+    "maximum_massa_trekken_ongeremd",
+    "maximum_trekken_massa_geremd",
+    "catalogusprijs",
+    "maximale_constructiesnelheid",
+    "laadvermogen",
+    "oplegger_geremd",
+    "aanhangwagen_autonoom_geremd",
+    "aanhangwagen_middenas_geremd",
+    "aantal_staanplaatsen",
+    "aantal_deuren",
+    "aantal_wielen",
+    "afstand_hart_koppeling_tot_achterzijde_voertuig",
+    "afstand_voorzijde_voertuig_tot_hart_koppeling",
+    "afwijkende_maximum_snelheid",
+    "lengte",
+    "breedte",
+    "technische_max_massa_voertuig",
+    "vermogen_massarijklaar",
+    "wielbasis",
+    "maximum_massa_samenstelling",
+    "aantal_rolstoelplaatsen",
+    "maximum_ondersteunende_snelheid",
+    "jaar_laatste_registratie_tellerstand",
+    "maximum_last_onder_de_vooras_sen_tezamen_koppeling",
+    "wielbasis_voertuig_minimum",
+    "wielbasis_voertuig_maximum",
+    "lengte_voertuig_minimum",
+    "lengte_voertuig_maximum",
+    "breedte_voertuig_minimum",
+    "breedte_voertuig_maximum",
+    "hoogte_voertuig",
+    "hoogte_voertuig_minimum",
+    "hoogte_voertuig_maximum",
+    "massa_bedrijfsklaar_minimaal",
+    "massa_bedrijfsklaar_maximaal",
+    "technisch_toelaatbaar_massa_koppelpunt",
+    "maximum_massa_technisch_maximaal",
+    "maximum_massa_technisch_minimaal",
+    "verticale_belasting_koppelpunt_getrokken_voertuig",
+    "gem_lading_wrde",
+    "massa_alt_aandr",
+    "aantal_passagiers_zitplaatsen_wettelijk",
+})
+_NUMERIC_FIELDS = frozenset(COLUMN_TRANSLATIONS[column] for column in _NUMERIC_COLUMNS)
 
 
 def translate_record(record: Dict[str, object]) -> Dict[str, object]:
-    translated = {}
-    for k, v in record.items():
-        english_key = COLUMN_TRANSLATIONS.get(k, k)
-        # Translate Dutch values to English
-        english_value = translate_dutch_value(v)
-        translated[english_key] = english_value
-    return translated
+    return translate_records((record,))[0]
+
+
+def translate_records(rows: Iterable[Dict[str, object]]) -> List[Dict[str, object]]:
+    """Translate a page of raw records; the one place the translation rules live."""
+    numeric = _NUMERIC_COLUMNS
+    translate_value = translate_dutch_value
+    return [
+        {_COL_GET(k, k): v if k in numeric else translate_value(v) for k, v in record.items()}
+        for record in rows
+    ]
 
 
 def translate_dutch_value(value: object) -> object:
     """Translate Dutch values to English."""
     if value is None:
         return value
-    
+    if isinstance(value, str):
+        return _translate_str(value)
+
     # Convert to string for comparison
-    str_value = str(value).strip()
-    
-    # Dutch to English value translations
-    value_translations = {
-        "Ja": "Yes",
-        "Nee": "No",
-        "ja": "Yes", 
-        "nee": "No",
-        "JA": "Yes",
-        "NEE": "No",
-        # Common Dutch phrases
-        "Niet geregistreerd": "Not registered",
-        "Niet van toepassing": "Not applicable",
-        "Onbekend": "Unknown",
-        "Leeg": "Empty",
-        "Niet beschikbaar": "Not available",
-        "Niet opgegeven": "Not specified",
-        "Niet bekend": "Not known",
-        "Niet ingevuld": "Not filled in",
-        "Niet vermeld": "Not mentioned",
-        "Niet opgenomen": "Not included",
-        # Vehicle types
-        "Aanhangwagen": "Trailer",
-        "Autonome aanhangwagen": "Autonomous trailer",
-        "Bedrijfsauto": "Commercial vehicle",
-        "Bromfiets": "Moped",
-        "Bus": "Bus",
-        "Driewielig motorrijtuig": "Three-wheeled motor vehicle",
-        "Land- of bosb aanhw of getr uitr stuk": "Agricultural or forestry trailer or towed equipment",
-        "Land- of bosbouwtrekker": "Agricultural or forestry tractor",
-        "Middenasaanhangwagen": "Central axle trailer",
-        "Mobiele machine": "Mobile machine",
-        "Motorfiets": "Motorcycle",
-        "Motorfiets met zijspan": "Motorcycle with sidecar",
-        "Motorrijtuig met beperkte snelheid": "Limited speed motor vehicle",
-        "Oplegger": "Semi-trailer",
-        "Personenauto": "Passenger car"
-    }
-    
+    str_value = str(value)
+    translated = _translate_str(str_value)
+    return value if translated == str_value else translated
+
+
+@lru_cache(maxsize=4096)
+def _translate_str(value: str) -> str:
+    # Only allocate a stripped copy when there is whitespace to remove
+    str_value = value.strip() if value and (value[0].isspace() or value[-1].isspace()) else value
+
     # Format dates if they look like dates (YYYYMMDD format)
     if len(str_value) == 8 and str_value.isdigit():
-        try:
-            year = str_value[:4]
-            month = str_value[4:6]
-            day = str_value[6:8]
-            return f"{year}-{month}-{day}"
-        except:
-            pass
-    
-    return value_translations.get(str_value, value)
+        return f"{str_value[:4]}-{str_value[4:6]}-{str_value[6:8]}"
+
+    return _VALUE_TRANSLATIONS.get(str_value, value)
+
+
+def iter_batches(
+    records: Iterable[Dict[str, object]], size: int
+) -> Iterator[List[Dict[str, object]]]:
+    batch: List[Dict[str, object]] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _soql_quote(value: str) -> str:
+    """Quote a string literal for a SoQL expression."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _soql_date(value: str, name: str) -> str:
+    # Validate up front instead of letting the API reject the query
+    if not re.fullmatch(r"\d{4}-\d{2}-\d{2}", value):
+        raise ValueError(f"{name} must be a date in YYYY-MM-DD format.")
+    # Convert YYYY-MM-DD to YYYYMMDD for API
+    return _soql_quote(value.replace("-", ""))
 
 
 def build_filters(category: Optional[str], license_plate: Optional[str], brand: Optional[str] = None, model: Optional[str] = None, date_from: Optional[str] = None, date_to: Optional[str] = None, order_by_recent: bool = False) -> Dict[str, str]:
@@ -225,13 +353,9 @@ def build_filters(category: Optional[str], license_plate: Optional[str], brand:
     if date_from or date_to:
         date_conditions = []
         if date_from:
-            # Convert YYYY-MM-DD to YYYYMMDD for API
-            date_from_formatted = date_from.replace("-", "")
-            date_conditions.append(f"datum_tenaamstelling >= '{date_from_formatted}'")
+            date_conditions.append(f"datum_tenaamstelling >= {_soql_date(date_from, 'date_from')}")
         if date_to:
-            # Convert YYYY-MM-DD to YYYYMMDD for API
-            date_to_formatted = date_to.replace("-", "")
-            date_conditions.append(f"datum_tenaamstelling <= '{date_to_formatted}'")
+            date_conditions.append(f"datum_tenaamstelling <= {_soql_date(date_to, 'date_to')}")
         
         if date_conditions:
             filters["$where"] = " AND ".join(date_conditions)
@@ -247,6 +371,154 @@ def build_filters(category: Optional[str], license_plate: Optional[str], brand:
     return filters
 
 
+def _decode_json(content: bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _build_session(
+    *,
+    pool_connections: int = 16,
+    pool_maxsize: int = 16,
+    pool_block: bool = False,
+    retries: int = 5,
+    backoff_factor: float = 0.5,
+    retry_statuses: Sequence[int] = RETRY_STATUS_CODES,
+) -> requests.Session:
+    session = requests.Session()
+    session.headers["Accept"] = "application/json"
+    # Let the final failed attempt surface as an HTTPError from raise_for_status
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=retry_statuses,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def configure_session(**options: object) -> None:
+    """Replace the shared session, e.g. with a larger pool for the web app.
+
+    Accepts the keyword arguments of :func:`_build_session`.
+    """
+    global _SESSION
+    session = _build_session(**options)
+    with _SESSION_LOCK:
+        previous, _SESSION = _SESSION, session
+    if previous is not None:
+        previous.close()
+
+
+def _timeouts(timeout: float) -> Tuple[float, float]:
+    # Fail fast on unreachable hosts while still allowing slow responses
+    return (min(CONNECT_TIMEOUT, timeout), timeout)
+
+
+def resolve_columns(columns: Optional[Sequence[str]]) -> Tuple[str, ...]:
+    """Validate requested English column names; ``None`` selects every column."""
+    if not columns:
+        return CSV_FIELDNAMES
+    unknown = [column for column in columns if column not in _DUTCH_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown column(s): {', '.join(unknown)}")
+    return tuple(dict.fromkeys(columns))
+
+
+def _select_clause(columns: Sequence[str], keyset: bool = False) -> str:
+    dutch_columns = [_DUTCH_COLUMNS[column] for column in columns]
+    # Keyset paging reads the plate off each page's last row
+    if keyset and "kenteken" not in dutch_columns:
+        dutch_columns.append("kenteken")
+    return ",".join(dutch_columns)
+
+
+def _get_session() -> requests.Session:
+    """Return the shared session so every RDW call reuses pooled connections."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = _build_session()
+    return _SESSION
+
+
+def _get_http2_client() -> Optional["httpx.Client"]:
+    """Shared HTTP/2 client for concurrent page fetches, if httpx[http2] is installed.
+
+    Concurrent pages are multiplexed over a few connections instead of each
+    holding its own pooled socket.
+    """
+    global _HTTP2_CLIENT
+    if _HTTP2_CLIENT is None:
+        with _HTTP2_LOCK:
+            if _HTTP2_CLIENT is None:
+                client: object = False
+                if httpx is not None:
+                    try:
+                        transport = httpx.HTTPTransport(
+                            http2=True,
+                            retries=2,
+                            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                        )
+                        client = httpx.Client(transport=transport, headers={"Accept": "application/json"})
+                    except ImportError:  # h2 is not installed
+                        pass
+                _HTTP2_CLIENT = client
+    return _HTTP2_CLIENT or None
+
+
+def _status_retry() -> Retry:
+    """The shared session's retry policy, for fetch paths that bypass requests."""
+    return _get_session().get_adapter(BASE_URL).max_retries
+
+
+def _retry_delay(retry: Retry, attempt: int, retry_after: Optional[str]) -> float:
+    # Honour a Retry-After given in seconds, else back off exponentially
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    return min(Retry.DEFAULT_BACKOFF_MAX, retry.backoff_factor * (2 ** attempt))
+
+
+def _http2_get_json(
+    client: "httpx.Client", params: Dict[str, object], headers: Dict[str, str], timeout: float
+) -> object:
+    # httpx only retries failed connections; retry throttling and gateway
+    # errors the way the requests session does
+    retry = _status_retry()
+    attempts = retry.total or 0
+    for attempt in range(attempts + 1):
+        try:
+            response = client.get(
+                BASE_URL,
+                params=params,
+                headers=headers,
+                timeout=httpx.Timeout(timeout, connect=min(CONNECT_TIMEOUT, timeout)),
+            )
+        except httpx.TimeoutException as exc:
+            raise requests.Timeout(str(exc)) from exc
+        except httpx.RequestError as exc:
+            raise requests.ConnectionError(str(exc)) from exc
+        if attempt == attempts or response.status_code not in retry.status_forcelist:
+            break
+        time.sleep(_retry_delay(retry, attempt, response.headers.get("Retry-After")))
+    if response.status_code >= 400:
+        raise _http_error(response.status_code, response.reason_phrase, str(response.url))
+    return _decode_json(response.content)
+
+
 def fetch_rdw_data(
     *,
     limit: Optional[int],
@@ -254,6 +526,7 @@ def fetch_rdw_data(
     filters: Dict[str, str],
     app_token: Optional[str],
     timeout: float = 30.0,
+    select_columns: Optional[Sequence[str]] = None,
 ) -> Iterator[Dict[str, object]]:
     fetched = 0
     offset = 0
@@ -261,15 +534,29 @@ def fetch_rdw_data(
     if app_token:
         headers["X-App-Token"] = app_token
 
-    session = requests.Session()
+    session = _get_session()
+    # Page by license plate unless the caller asked for a specific order;
+    # unlike $offset this never makes the server skip over earlier pages
+    keyset = "$order" not in filters
+    last_plate: Optional[str] = None
 
     while True:
-        params: Dict[str, object] = {"$limit": page_size, "$offset": offset}
+        params: Dict[str, object] = {"$limit": page_size}
+        if select_columns:
+            params["$select"] = _select_clause(select_columns, keyset)
         params.update(filters)
+        if keyset:
+            params["$order"] = "kenteken"
+            if last_plate is not None:
+                condition = f"kenteken > {_soql_quote(last_plate)}"
+                where = filters.get("$where")
+                params["$where"] = f"({where}) AND {condition}" if where else condition
+        else:
+            params["$offset"] = offset
 
-        response = session.get(BASE_URL, params=params, headers=headers, timeout=timeout)
+        response = session.get(BASE_URL, params=params, headers=headers, timeout=_timeouts(timeout))
         response.raise_for_status()
-        rows: List[Dict[str, object]] = response.json()
+        rows: List[Dict[str, object]] = _decode_json(response.content)
         if not rows:
             break
 
@@ -284,24 +571,335 @@ def fetch_rdw_data(
 
         if len(rows) < page_size:
             break
-        offset += page_size
+        if keyset:
+            last_plate = str(rows[-1]["kenteken"])
+        else:
+            offset += page_size
+
+
+def _http_error(status: int, reason: Optional[str], url: str) -> requests.HTTPError:
+    # Mirror requests' error so callers handle both fetch paths the same way
+    response = requests.Response()
+    response.status_code = status
+    response.reason = reason
+    response.url = url
+    return requests.HTTPError(f"{status} Error: {reason} for url: {url}", response=response)
+
+
+async def fetch_rdw_pages_async(
+    *,
+    limit: Optional[int],
+    page_size: int,
+    filters: Dict[str, str],
+    app_token: Optional[str],
+    timeout: float = 30.0,
+    concurrency: int = 8,
+    select_columns: Optional[Sequence[str]] = None,
+) -> AsyncIterator[List[Dict[str, object]]]:
+    """Download up to ``concurrency`` pages at a time, yielding them in order."""
+    if aiohttp is None:
+        raise RuntimeError("Install aiohttp to enable concurrent downloads.")
+    headers = {"Accept": "application/json"}
+    if app_token:
+        headers["X-App-Token"] = app_token
+
+    # Offset pages are only stable under an explicit ordering; plates are
+    # unique, and match the sequential path's keyset order
+    base_params = {"$order": "kenteken", **filters, "$limit": str(page_size)}
+    if select_columns:
+        base_params["$select"] = _select_clause(select_columns)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    # Parallel pages are more likely to be throttled; back off the way the
+    # requests session does instead of failing on the first 429/5xx
+    retry = _status_retry()
+    attempts = retry.total or 0
+
+    async def fetch_page(session: "aiohttp.ClientSession", offset: int) -> List[Dict[str, object]]:
+        params = {**base_params, "$offset": str(offset)}
+        async with semaphore:
+            for attempt in range(attempts + 1):
+                try:
+                    async with session.get(BASE_URL, params=params) as response:
+                        if attempt < attempts and response.status in retry.status_forcelist:
+                            delay = _retry_delay(retry, attempt, response.headers.get("Retry-After"))
+                        elif response.status >= 400:
+                            raise _http_error(response.status, response.reason, str(response.url))
+                        else:
+                            return _decode_json(await response.read())
+                except asyncio.TimeoutError as exc:
+                    raise requests.Timeout(f"Request timed out after {timeout}s") from exc
+                except aiohttp.ClientError as exc:
+                    raise requests.ConnectionError(str(exc)) from exc
+                await asyncio.sleep(delay)
 
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    async with aiohttp.ClientSession(
+        connector=connector, headers=headers, timeout=client_timeout
+    ) as session:
+        fetched = 0
+        offset = 0
+        while limit is None or fetched < limit:
+            pages = concurrency
+            if limit is not None:
+                pages = min(pages, -(-(limit - fetched) // page_size))
+            offsets = [offset + index * page_size for index in range(pages)]
+            results = await asyncio.gather(*(fetch_page(session, page) for page in offsets))
 
+            for rows in results:
+                if limit is not None and fetched + len(rows) >= limit:
+                    yield rows[: limit - fetched]
+                    return
+                if rows:
+                    yield rows
+                    fetched += len(rows)
+                if len(rows) < page_size:
+                    return
+            offset += pages * page_size
+
+
+def fetch_rdw_data_concurrent(
+    *,
+    limit: Optional[int],
+    page_size: int,
+    filters: Dict[str, str],
+    app_token: Optional[str],
+    timeout: float = 30.0,
+    concurrency: int = 8,
+    select_columns: Optional[Sequence[str]] = None,
+) -> Iterator[Dict[str, object]]:
+    """Synchronous row iterator over :func:`fetch_rdw_pages_async`."""
+    loop = asyncio.new_event_loop()
+    pages = fetch_rdw_pages_async(
+        limit=limit,
+        page_size=page_size,
+        filters=filters,
+        app_token=app_token,
+        timeout=timeout,
+        concurrency=concurrency,
+        select_columns=select_columns,
+    )
+    try:
+        while True:
+            try:
+                rows = loop.run_until_complete(pages.__anext__())
+            except StopAsyncIteration:
+                return
+            yield from rows
+    finally:
+        loop.run_until_complete(pages.aclose())
+        loop.close()
+
+
+def count_rdw_rows(
+    *,
+    filters: Dict[str, str],
+    app_token: Optional[str],
+    timeout: float = 30.0,
+) -> int:
+    """Number of rows matching ``filters``, via a ``count(*)`` query."""
+    headers = {"Accept": "application/json"}
+    if app_token:
+        headers["X-App-Token"] = app_token
+    params = {key: value for key, value in filters.items() if key != "$order"}
+    params["$select"] = "count(*)"
+    response = _get_session().get(BASE_URL, params=params, headers=headers, timeout=_timeouts(timeout))
+    response.raise_for_status()
+    data = _decode_json(response.content)
+    return int(data[0]["count"]) if data else 0
+
+
+def fetch_rdw_data_parallel(
+    *,
+    limit: Optional[int],
+    page_size: int,
+    filters: Dict[str, str],
+    app_token: Optional[str],
+    timeout: float = 30.0,
+    concurrency: int = 4,
+    select_columns: Optional[Sequence[str]] = None,
+) -> Iterator[Dict[str, object]]:
+    """Download offset pages on a thread pool over the shared session.
+
+    Rows come out in offset order, sorted by license plate like
+    :func:`fetch_rdw_data` unless the filters set an order. Without a
+    ``limit`` the row count is looked up first. Pages go over HTTP/2 when
+    httpx[http2] is installed.
+    """
+    if limit is None:
+        limit = count_rdw_rows(filters=filters, app_token=app_token, timeout=timeout)
+    if limit <= 0:
+        return
+    headers = {"Accept": "application/json"}
+    if app_token:
+        headers["X-App-Token"] = app_token
+
+    session = _get_session()
+    # Offset pages are only stable under an explicit ordering; plates are
+    # unique, and match the sequential path's keyset order
+    base_params: Dict[str, object] = {"$order": "kenteken", **filters}
+    if select_columns:
+        base_params["$select"] = _select_clause(select_columns)
+
+    client = _get_http2_client()
+
+    def fetch_page(offset: int) -> List[Dict[str, object]]:
+        params = {**base_params, "$limit": min(page_size, limit - offset), "$offset": offset}
+        if client is not None:
+            return _http2_get_json(client, params, headers, timeout)
+        response = session.get(BASE_URL, params=params, headers=headers, timeout=_timeouts(timeout))
+        response.raise_for_status()
+        return _decode_json(response.content)
+
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="rdw-page")
+    try:
+        # Keep a bounded window in flight and drain it in submission order
+        offsets = iter(range(0, limit, page_size))
+        pending = deque(executor.submit(fetch_page, offset) for offset in islice(offsets, 2 * concurrency))
+        while pending:
+            rows = pending.popleft().result()
+            yield from rows
+            if len(rows) < page_size:
+                return
+            offset = next(offsets, None)
+            if offset is not None:
+                pending.append(executor.submit(fetch_page, offset))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+@lru_cache(maxsize=1)
 def resolve_app_token(cli_token: Optional[str] = None) -> Optional[str]:
+    # Cached; call resolve_app_token.cache_clear() after changing RDW_APP_TOKEN
     if cli_token:
         return cli_token
     return os.getenv("RDW_APP_TOKEN")
 
 
-def export_to_excel(records: List[Dict[str, object]], path: str) -> None:
-    if pd is None:
-        raise RuntimeError("Install pandas and openpyxl to enable Excel export.")
-    if len(records) > EXCEL_MAX_ROWS:
+class ExcelWriter:
+    """Stream translated records into a write-only Excel workbook."""
+
+    def __init__(self, path: str, fieldnames: Sequence[str] = CSV_FIELDNAMES) -> None:
+        if openpyxl is None:
+            raise RuntimeError("Install openpyxl to enable Excel export.")
+        self.path = path
+        self.fieldnames = tuple(fieldnames)
+        self.rows = 0
+        self._workbook = openpyxl.Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet("RDW")
+        self._sheet.append(self.fieldnames)
+
+    def append(self, record: Dict[str, object]) -> None:
+        # One row is taken by the header
+        if self.rows >= EXCEL_MAX_ROWS - 1:
+            raise RuntimeError(
+                f"Excel cannot store more than {EXCEL_MAX_ROWS - 1:,} rows. "
+                "Use CSV or filter the dataset."
+            )
+        self._sheet.append([record.get(field) for field in self.fieldnames])
+        self.rows += 1
+
+    def save(self) -> None:
+        self._workbook.save(self.path)
+
+
+def export_to_excel(
+    records: List[Dict[str, object]], path: str, fieldnames: Sequence[str] = CSV_FIELDNAMES
+) -> None:
+    if len(records) >= EXCEL_MAX_ROWS:
         raise RuntimeError(
             f"Excel cannot store {len(records):,} rows. Use CSV or filter the dataset."
         )
-    df = pd.DataFrame.from_records(records)
-    df.to_excel(path, index=False)
+    writer = ExcelWriter(path, fieldnames)
+    for record in records:
+        writer.append(record)
+    writer.save()
+
+
+class SoABuffer:
+    """Collect translated records column by column for columnar exports."""
+
+    def __init__(self, fieldnames: Sequence[str] = CSV_FIELDNAMES) -> None:
+        self.columns: Dict[str, List[object]] = {field: [] for field in fieldnames}
+        self.rows = 0
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def add(self, record: Dict[str, object]) -> None:
+        # Fill every column on every row so the columns stay equally long
+        for field, column in self.columns.items():
+            column.append(record.get(field))
+        self.rows += 1
+
+
+ExportRows = Union[List[Dict[str, object]], SoABuffer]
+
+
+def _to_arrow_table(records: ExportRows, fieldnames: Sequence[str]) -> "pa.Table":
+    # Socrata returns every field as text, so a fixed string schema keeps
+    # the column set and types stable regardless of which fields are present
+    if isinstance(records, SoABuffer):
+        schema = pa.schema([(field, pa.string()) for field in records.columns])
+        return pa.Table.from_pydict(records.columns, schema=schema)
+    schema = pa.schema([(field, pa.string()) for field in fieldnames])
+    return pa.Table.from_pylist(records, schema=schema)
+
+
+def export_to_parquet(
+    records: ExportRows, path: str, fieldnames: Sequence[str] = CSV_FIELDNAMES
+) -> None:
+    """Write records to Parquet; a SoABuffer supplies its own column list."""
+    if pa is None:
+        raise RuntimeError("Install pyarrow to enable Parquet export.")
+    table = _to_arrow_table(records, fieldnames)
+    pq.write_table(table, path, compression="zstd", compression_level=3)
+
+
+def export_to_csv_arrow(
+    records: ExportRows, path: str, fieldnames: Sequence[str] = CSV_FIELDNAMES
+) -> None:
+    """Write records to CSV via pyarrow; a SoABuffer supplies its own column list."""
+    if pa is None:
+        raise RuntimeError("Install pyarrow to enable fast CSV export.")
+    table = _to_arrow_table(records, fieldnames)
+    pa_csv.write_csv(table, path)
+
+
+def _csv_field(value: object) -> str:
+    if value is None:
+        return ""
+    text = str(value)
+    if any(char in text for char in ',"\r\n'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def export_columns_to_csv(buffer: SoABuffer, path: str) -> None:
+    """Write a column buffer as CSV, through pyarrow when it is installed."""
+    if pa is not None:
+        export_to_csv_arrow(buffer, path)
+        return
+
+    # Numeric columns never need quoting, so only text columns are escaped;
+    # each column is formatted in one pass and rows are stitched with ``%``
+    columns = [
+        ["" if value is None else value for value in values]
+        if field in _NUMERIC_FIELDS
+        else [_csv_field(value) for value in values]
+        for field, values in buffer.columns.items()
+    ]
+    row_format = ",".join(["%s"] * len(columns)) + "\r\n"
+    header = ",".join(_csv_field(field) for field in buffer.columns) + "\r\n"
+    with open(path, "wb", buffering=CSV_BUFFER_SIZE) as handle:
+        handle.write(header.encode("utf-8"))
+        rows = zip(*columns)
+        while True:
+            chunk = "".join(row_format % row for row in islice(rows, CSV_BATCH_SIZE))
+            if not chunk:
+                break
+            handle.write(chunk.encode("utf-8"))
 
 
 def translated_columns() -> List[str]:
@@ -313,7 +911,7 @@ def fetch_categories(app_token: Optional[str], timeout: float = 30.0) -> List[st
     if app_token:
         headers["X-App-Token"] = app_token
     params = {"$select": "distinct voertuigsoort", "$order": "voertuigsoort"}
-    response = requests.get(BASE_URL, params=params, headers=headers, timeout=timeout)
+    response = _get_session().get(BASE_URL, params=params, headers=headers, timeout=_timeouts(timeout))
     response.raise_for_status()
     data = response.json()
     return [row["voertuigsoort"] for row in data if row.get("voertuigsoort")]
@@ -338,7 +936,7 @@ def get_total_plate_count(app_token: str, timeout: float = 30.0) -> int:
             "$$app_token": app_token
         }
         
-        response = requests.get(url, params=params, timeout=timeout)
+        response = _get_session().get(url, params=params, timeout=_timeouts(timeout))
         response.raise_for_status()
         
         data = response.json()
@@ -362,7 +960,7 @@ def get_available_brands(app_token: str, timeout: float = 30.0) -> List[str]:
             "$$app_token": app_token
         }
         
-        response = requests.get(url, params=params, timeout=timeout)
+        response = _get_session().get(url, params=params, timeout=_timeouts(timeout))
         response.raise_for_status()
         
         data = response.json()
@@ -383,14 +981,14 @@ def get_models_for_brand(brand: str, app_token: str, timeout: float = 30.0) -> L
         url = "https://opendata.rdw.nl/resource/m9d7-ebf2.json"
         params = {
             "$select": "handelsbenaming",
-            "$where": f"merk = '{brand.upper()}'",
+            "$where": f"merk = {_soql_quote(brand.upper())}",
             "$group": "handelsbenaming",
             "$order": "handelsbenaming",
             "$limit": 1000,
             "$$app_token": app_token
         }
         
-        response = requests.get(url, params=params, timeout=timeout)
+        response = _get_session().get(url, params=params, timeout=_timeouts(timeout))
         response.raise_for_status()
         
         data = response.json()
@@ -2,63 +2,195 @@
 from __future__ import annotations
 
 import csv
-import io
+import hashlib
+import hmac
+import math
 import os
-from typing import Dict, List, Optional
-
-from flask import (Flask, Response, flash, jsonify, redirect, render_template,
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import lru_cache, wraps
+from itertools import chain
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Tuple, TypeVar
+
+from flask import (Flask, Response, flash, g, jsonify, make_response, redirect,
                    request, stream_with_context, url_for)
+from markupsafe import Markup, escape
 import requests
 
 import rdw_client as rdw
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:
+    from flask_compress import Compress
+except ImportError:  # pragma: no cover
+    Compress = None  # type: ignore
+
+try:
+    from flask_limiter import Limiter
+    from flask_limiter.util import get_remote_address
+except ImportError:  # pragma: no cover
+    Limiter = None  # type: ignore
+
+try:
+    from waitress import serve
+except ImportError:  # pragma: no cover
+    serve = None  # type: ignore
+
 # Load environment variables
 from dotenv import load_dotenv
 load_dotenv()
 
+DEV_MODE = os.getenv("FLASK_DEV") == "1"
+# Resolved once; POST /admin/reload-token picks up a rotated token
+APP_TOKEN = rdw.resolve_app_token()
 MAX_WEB_LIMIT = 10000
+# Per-request RDW timeout bounds for ?timeout=, in seconds
+DEFAULT_TIMEOUT = 30.0
+MIN_TIMEOUT = 1.0
+MAX_TIMEOUT = 120.0
+# Categories, brands and models change at most daily
+CACHE_TTL = 600.0
+CACHE_REFRESH_AHEAD = 30.0
+CACHE_MAX_ENTRIES = 64
+# Large downloads are split into smaller pages fetched side by side
+PARALLEL_PAGE_SIZE = 2500
+PARALLEL_PAGES = 4
+# Streamed CSV downloads are flushed in chunks of this many rows or bytes
+CSV_CHUNK_ROWS = 256
+CSV_CHUNK_BYTES = 64 * 1024
+# "Recent records" on the landing page are the same for everyone
+RECENT_LIMIT = 20
+RECENT_REFRESH_INTERVAL = 120.0
+# The plate count behind the live counter in the page footer
+TOTAL_PLATES_REFRESH_INTERVAL = 60.0
+
+F = TypeVar("F", bound=Callable[..., object])
+
+# Page renders fan out to several RDW calls at once; give them a bigger,
+# bounded pool and keep retries short so a slow upstream fails fast
+rdw.configure_session(
+    pool_connections=16,
+    pool_maxsize=32,
+    pool_block=True,
+    retries=2,
+    backoff_factor=0.2,
+    retry_statuses=(429, 502, 503, 504),
+)
+
+# Shared by all requests for the independent upstream lookups in index()
+_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="rdw")
 
 app = Flask(__name__)
 app.secret_key = "change-me"  # replace in production
 app.config["JSON_AS_ASCII"] = False
+# Templates only change on deploy outside of development
+app.jinja_env.auto_reload = DEV_MODE
+app.jinja_env.cache_size = 400
+# CSV downloads and JSON/HTML pages are repetitive text; compress them,
+# including the streamed CSV, when flask-compress is installed
+app.config["COMPRESS_MIMETYPES"] = ["text/csv", "application/json", "text/html"]
+app.config["COMPRESS_LEVEL"] = 6
+app.config["COMPRESS_MIN_SIZE"] = 500
+if Compress is not None:
+    Compress(app)
+
+# Every uncached hit fans out to RDW, so cap how fast one client can ask.
+# Point RATELIMIT_STORAGE_URI at Redis when running several worker processes.
+if Limiter is not None:
+    limiter = Limiter(
+        get_remote_address,
+        app=app,
+        default_limits=["60/minute"],
+        storage_uri=os.getenv("RATELIMIT_STORAGE_URI", "memory://"),
+    )
+    rate_limit = limiter.limit
+else:  # pragma: no cover
+    def rate_limit(_: str) -> Callable[[F], F]:
+        return lambda func: func
+
+
+# The column dictionary is static; escape it once instead of on every render
+SAFE_COLUMN_MAP = {
+    english: Markup(escape(turkish)) for english, turkish in rdw.TURKISH_COLUMN_TRANSLATIONS.items()
+}
+INDEX_TEMPLATE = app.jinja_env.get_template("index.html")
 
 
+def json_response(payload: object, status: int = 200) -> Response:
+    """Serialize ``payload`` with orjson when available, else jsonify."""
+    if orjson is None:
+        response = jsonify(payload)
+        response.status_code = status
+        return response
+    body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return Response(body, status=status, mimetype="application/json")
+
+
+@lru_cache(maxsize=128)
 def parse_limit(raw: Optional[str]) -> int:
-    try:
-        value = int(raw) if raw else 50
-    except ValueError:
+    # Digit checks instead of try/int/except: junk limits from bots are common
+    text = raw.strip() if raw else ""
+    if text[:1] in ("+", "-"):
+        if not text[1:].isdecimal():
+            return 50
+        if text[0] == "-":
+            return 1
+        text = text[1:]
+    elif not text.isdecimal():
         return 50
-    return max(1, min(MAX_WEB_LIMIT, value))
+    # int() refuses very long digit strings; anything this long is over the cap
+    text = text.lstrip("0")
+    if len(text) > len(str(MAX_WEB_LIMIT)):
+        return MAX_WEB_LIMIT
+    value = int(text) if text else 0
+    return 1 if value < 1 else MAX_WEB_LIMIT if value > MAX_WEB_LIMIT else value
 
 
-def query_records(category: str, license_plate: str, limit: int, timeout: float, brand: str = "", model: str = "", date_from: str = "", date_to: str = "", order_by_recent: bool = False) -> Dict[str, object]:
-    # Convert English category back to Dutch for API call
-    dutch_category = None
-    if category:
-        category_map = rdw.get_category_translation_map()
-        # Find Dutch category for English category
-        for dutch, english in category_map.items():
-            if english == category:
-                dutch_category = dutch
-                break
-        if not dutch_category:
-            dutch_category = category  # fallback to original if not found
-    
+@lru_cache(maxsize=1)
+def english_to_dutch_categories() -> Dict[str, str]:
+    """Reverse of rdw.get_category_translation_map(), built once."""
+    return {english: dutch for dutch, english in rdw.get_category_translation_map().items()}
+
+
+def query_records_stream(category: str, license_plate: str, limit: int, timeout: float, brand: str = "", model: str = "", date_from: str = "", date_to: str = "", order_by_recent: bool = False, parallel: bool = False) -> Iterator[Dict[str, object]]:
+    # Convert English category back to Dutch for API call, falling back to
+    # the original if it isn't a known translation
+    dutch_category = english_to_dutch_categories().get(category, category) if category else None
+
+    # Invalid filter input raises ValueError, which the views answer with 400
     filters = rdw.build_filters(dutch_category, license_plate or None, brand or None, model or None, date_from or None, date_to or None, order_by_recent)
-    app_token = rdw.resolve_app_token()
-    translated: List[Dict[str, object]] = []
-    total = 0
+    app_token = APP_TOKEN
 
     try:
-        for record in rdw.fetch_rdw_data(
-            limit=limit,
-            page_size=rdw.DEFAULT_PAGE_SIZE,
-            filters=filters,
-            app_token=app_token,
-            timeout=timeout,
-        ):
-            translated.append(rdw.translate_record(record))
-            total += 1
+        if parallel:
+            page_size = PARALLEL_PAGE_SIZE
+            raw_records = rdw.fetch_rdw_data_parallel(
+                limit=limit,
+                page_size=page_size,
+                filters=filters,
+                app_token=app_token,
+                timeout=timeout,
+                concurrency=PARALLEL_PAGES,
+            )
+        else:
+            page_size = rdw.DEFAULT_PAGE_SIZE
+            raw_records = rdw.fetch_rdw_data(
+                limit=limit,
+                page_size=page_size,
+                filters=filters,
+                app_token=app_token,
+                timeout=timeout,
+            )
+        # Pages arrive whole, so translate them a page at a time
+        for page in rdw.iter_batches(raw_records, page_size):
+            yield from rdw.translate_records(page)
     except requests.HTTPError as exc:
         message = "RDW API access error."
         if exc.response is not None and exc.response.status_code == 403:
@@ -67,11 +199,60 @@ def query_records(category: str, license_plate: str, limit: int, timeout: float,
     except requests.RequestException as exc:
         raise RuntimeError("RDW API request failed.") from exc
 
-    return {"records": translated, "total": total}
-
 
+def query_records(category: str, license_plate: str, limit: int, timeout: float, brand: str = "", model: str = "", date_from: str = "", date_to: str = "", order_by_recent: bool = False, parallel: bool = False) -> Dict[str, object]:
+    translated = list(query_records_stream(category, license_plate, limit, timeout, brand, model, date_from, date_to, order_by_recent, parallel))
+    return {"records": translated, "total": len(translated)}
+
+
+def ttl_cached(key: Callable[..., Hashable]) -> Callable[[F], F]:
+    """Cache non-empty results for CACHE_TTL seconds.
+
+    An entry read within CACHE_REFRESH_AHEAD seconds of expiring is
+    reloaded in the background, so frequently hit entries never go cold.
+    Empty results (the helpers' failure values) are not cached.
+    """
+
+    def decorator(func: F) -> F:
+        entries: Dict[Hashable, Tuple[float, object]] = {}
+        refreshing = set()
+        lock = threading.Lock()
+
+        def load(cache_key: Hashable, args: tuple, kwargs: dict) -> object:
+            try:
+                value = func(*args, **kwargs)
+            finally:
+                with lock:
+                    refreshing.discard(cache_key)
+            if value:
+                with lock:
+                    if cache_key not in entries and len(entries) >= CACHE_MAX_ENTRIES:
+                        entries.pop(next(iter(entries)))
+                    entries[cache_key] = (time.monotonic() + CACHE_TTL, value)
+            return value
+
+        @wraps(func)
+        def wrapper(*args: object, **kwargs: object) -> object:
+            cache_key = key(*args, **kwargs)
+            now = time.monotonic()
+            with lock:
+                entry = entries.get(cache_key)
+                if entry is not None and entry[0] > now:
+                    if entry[0] - now < CACHE_REFRESH_AHEAD and cache_key not in refreshing:
+                        refreshing.add(cache_key)
+                        _EXECUTOR.submit(load, cache_key, args, kwargs)
+                    return entry[1]
+            return load(cache_key, args, kwargs)
+
+        wrapper.cache_clear = entries.clear  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@ttl_cached(key=lambda timeout: "categories")
 def ensure_categories(timeout: float) -> List[str]:
-    app_token = rdw.resolve_app_token()
+    app_token = APP_TOKEN
     try:
         dutch_categories = rdw.fetch_categories(app_token=app_token, timeout=timeout)
         return rdw.translate_categories(dutch_categories)
@@ -79,14 +260,126 @@ def ensure_categories(timeout: float) -> List[str]:
         return []
 
 
+get_available_brands = ttl_cached(key=lambda app_token, timeout: app_token)(rdw.get_available_brands)
+get_models_for_brand = ttl_cached(
+    key=lambda brand, app_token, timeout: (brand.upper(), app_token)
+)(rdw.get_models_for_brand)
+
+
+_RECENT_CACHE: Dict[str, object] = {}
+_RECENT_LOCK = threading.Lock()
+
+
+def _refresh_every(interval: float, refresh: Callable[[], None], name: str) -> None:
+    """Call ``refresh`` every ``interval`` seconds on a daemon thread."""
+
+    def run() -> None:
+        while True:
+            time.sleep(interval)
+            try:
+                refresh()
+            except Exception:  # pragma: no cover
+                app.logger.exception("Background refresh %s failed", name)
+
+    threading.Thread(target=run, name=name, daemon=True).start()
+
+
+def refresh_recent_records() -> None:
+    try:
+        result = query_records("", "", RECENT_LIMIT, 30.0, order_by_recent=True)
+    except RuntimeError as exc:
+        # A stale list is fine for the landing page
+        app.logger.warning("Keeping stale recent records: %s", exc)
+        return
+    with _RECENT_LOCK:
+        _RECENT_CACHE["result"] = result
+        _RECENT_CACHE["updated"] = time.time()
+
+
+def get_recent_records(timeout: float) -> Dict[str, object]:
+    """Latest recent-records snapshot.
+
+    The first call loads it and starts refreshing it in the background, so
+    later landing page hits don't touch RDW at all.
+    """
+    with _RECENT_LOCK:
+        cached = _RECENT_CACHE.get("result")
+    if cached is not None:
+        return cached
+    result = query_records("", "", RECENT_LIMIT, timeout, order_by_recent=True)
+    with _RECENT_LOCK:
+        first = "result" not in _RECENT_CACHE
+        _RECENT_CACHE["result"] = result
+        _RECENT_CACHE["updated"] = time.time()
+    if first:
+        _refresh_every(RECENT_REFRESH_INTERVAL, refresh_recent_records, "rdw-recent")
+    return result
+
+
+_TOTAL_PLATES = 0
+_TOTAL_PLATES_LOCK = threading.Lock()
+_TOTAL_PLATES_STARTED = threading.Event()
+
+
+def refresh_total_plates() -> None:
+    global _TOTAL_PLATES
+    count = rdw.get_total_plate_count(APP_TOKEN, 30.0)
+    # 0 means the lookup failed; keep showing the last good count
+    if count:
+        _TOTAL_PLATES = count
+
+
+def current_total_plates() -> int:
+    """In-memory plate count, kept fresh by a background thread.
+
+    The first call loads it and starts the refresher; after that, reads
+    never touch RDW.
+    """
+    if not _TOTAL_PLATES_STARTED.is_set():
+        with _TOTAL_PLATES_LOCK:
+            if not _TOTAL_PLATES_STARTED.is_set():
+                refresh_total_plates()
+                _refresh_every(TOTAL_PLATES_REFRESH_INTERVAL, refresh_total_plates, "rdw-total-plates")
+                _TOTAL_PLATES_STARTED.set()
+    return _TOTAL_PLATES
+
+
+def recent_records_updated() -> Optional[float]:
+    """When the recent-records snapshot was last refreshed, if ever."""
+    with _RECENT_LOCK:
+        return _RECENT_CACHE.get("updated")
+
+
+def _remaining(deadline: float) -> float:
+    return max(0.0, deadline - time.monotonic())
+
+
+def _collect(future: Future, default: object, deadline: float) -> object:
+    """Wait for a background lookup, falling back to ``default`` if it fails."""
+    try:
+        return future.result(timeout=_remaining(deadline))
+    except (RuntimeError, requests.RequestException, FutureTimeoutError):
+        return default
+
+
+@app.before_request
+def start_deadline() -> None:
+    # Everything a request does upstream has to finish by g.deadline; past
+    # it the request answers 504 instead of queueing for more pool slots
+    timeout = request.args.get("timeout", type=float) or DEFAULT_TIMEOUT
+    # Bound it so inf/nan/huge values can't disable the deadline
+    g.timeout = min(max(timeout, MIN_TIMEOUT), MAX_TIMEOUT) if math.isfinite(timeout) else DEFAULT_TIMEOUT
+    g.deadline = time.monotonic() + g.timeout + rdw.CONNECT_TIMEOUT
+
+
 @app.route("/")
-def index() -> str:
+def index() -> Response:
     category = request.args.get("category", "")
     license_plate = request.args.get("license_plate", "")
     brand = request.args.get("brand", "")
     model = request.args.get("model", "")
     limit = parse_limit(request.args.get("limit"))
-    timeout = request.args.get("timeout", type=float) or 30.0
+    timeout = g.timeout
     date_from = request.args.get("date_from", "")
     date_to = request.args.get("date_to", "")
 
@@ -94,51 +387,58 @@ def index() -> str:
     total = 0
     error: Optional[str] = None
     searched = "submitted" in request.args
-    total_plates = 0
 
-    # If no search was performed, show recent records by default
+    # The unfiltered landing page only changes when the recent-records
+    # snapshot does, so idle tabs can revalidate without any upstream work
+    last_modified = None if searched else recent_records_updated()
+    if last_modified is not None:
+        since = request.if_modified_since
+        if since is not None and since.timestamp() >= int(last_modified):
+            return Response(status=304)
+
+    # The record query and the sidebar lookups are independent upstream
+    # calls, so run them side by side instead of one after another
+    app_token = APP_TOKEN
     if not searched:
-        try:
-            # Get recent records without any filters, ordered by registration date
-            result = query_records("", "", 20, timeout, "", "", "", "", True)  # Default 20 recent records
-            records = result["records"]
-            total = result["total"]
-        except RuntimeError as exc:
-            error = str(exc)
+        # Recent records without any filters, ordered by registration date
+        records_future = _EXECUTOR.submit(get_recent_records, timeout)
     else:
         # User performed a search with filters
-        try:
-            result = query_records(category, license_plate, limit, timeout, brand, model, date_from, date_to)
-            records = result["records"]
-            total = result["total"]
-            if total == 0:
-                flash("No records found matching the selected filters.", "warning")
-        except RuntimeError as exc:
-            error = str(exc)
-            flash(error, "danger")
-
+        records_future = _EXECUTOR.submit(query_records, category, license_plate, limit, timeout, brand, model, date_from, date_to)
+    categories_future = _EXECUTOR.submit(ensure_categories, timeout)
+    total_plates_future = _EXECUTOR.submit(current_total_plates)
+    brands_future = _EXECUTOR.submit(get_available_brands, app_token, timeout)
+    models_future = _EXECUTOR.submit(get_models_for_brand, brand, app_token, timeout) if brand else None
+
+    deadline = g.deadline
+    status = 200
     try:
-        categories = ensure_categories(timeout)
-        # Get total plate count
-        app_token = rdw.resolve_app_token()
-        total_plates = rdw.get_total_plate_count(app_token, timeout)
-        
-        # Get available brands
-        brands = rdw.get_available_brands(app_token, timeout)
-        
-        # Get models for selected brand
-        models = []
-        if brand:
-            models = rdw.get_models_for_brand(brand, app_token, timeout)
+        result = records_future.result(timeout=_remaining(deadline))
+        records = result["records"]
+        total = result["total"]
+        if searched and total == 0:
+            flash("No records found matching the selected filters.", "warning")
     except RuntimeError as exc:
-        if not error:  # Only set error if not already set from search
-            error = str(exc)
-        categories = []
-        brands = []
-        models = []
-
-    return render_template(
-        "index.html",
+        error = str(exc)
+        if searched:
+            flash(error, "danger")
+    except ValueError as exc:
+        error = str(exc)
+        flash(error, "danger")
+        status = 400
+    except FutureTimeoutError:
+        records_future.cancel()
+        error = "RDW API request timed out."
+        if searched:
+            flash(error, "danger")
+            status = 504
+
+    categories = _collect(categories_future, [], deadline)
+    total_plates = _collect(total_plates_future, 0, deadline)
+    brands = _collect(brands_future, [], deadline)
+    models = _collect(models_future, [], deadline) if models_future is not None else []
+
+    context = dict(
         category=category,
         categories=categories,
         license_plate=license_plate,
@@ -151,61 +451,136 @@ def index() -> str:
         total=total,
         error=error,
         searched=searched,
-        column_map=rdw.TURKISH_COLUMN_TRANSLATIONS,
+        column_map=SAFE_COLUMN_MAP,
         max_limit=MAX_WEB_LIMIT,
         total_plates=total_plates,
     )
+    # Adds request, url_for, get_flashed_messages etc. like render_template
+    app.update_template_context(context)
+    template = app.jinja_env.get_template("index.html") if DEV_MODE else INDEX_TEMPLATE
+    response = make_response(template.render(context), status)
+    if not searched and status == 200 and error is None:
+        response.last_modified = recent_records_updated()
+        response.cache_control.no_cache = True
+    return response
 
 
 @app.route("/api/total-count")
+@rate_limit("10/minute")
 def api_total_count() -> Response:
     """API endpoint to get total plate count."""
     try:
-        app_token = rdw.resolve_app_token()
-        total_plates = rdw.get_total_plate_count(app_token, 30.0)
-        return jsonify({"total_plates": total_plates})
+        total_plates = current_total_plates()
+        response = json_response({"total_plates": total_plates})
+        response.cache_control.public = True
+        response.cache_control.max_age = int(TOTAL_PLATES_REFRESH_INTERVAL)
+        response.set_etag(hashlib.sha1(str(total_plates).encode()).hexdigest())
+        return response.make_conditional(request)
     except Exception as exc:
-        return jsonify({"error": str(exc)}), 500
+        return json_response({"error": str(exc)}, 500)
 
 
-@app.route("/download.csv")
-def download_csv() -> Response:
+@app.route("/api/records")
+def api_records() -> Response:
+    """API endpoint returning translated records for the same filters as /download.csv."""
     category = request.args.get("category", "")
     license_plate = request.args.get("license_plate", "")
     brand = request.args.get("brand", "")
     model = request.args.get("model", "")
     limit = parse_limit(request.args.get("limit"))
-    timeout = request.args.get("timeout", type=float) or 30.0
+    timeout = g.timeout
     date_from = request.args.get("date_from", "")
     date_to = request.args.get("date_to", "")
 
+    future = _EXECUTOR.submit(query_records, category, license_plate, limit, timeout, brand, model, date_from, date_to, parallel=True)
     try:
-        result = query_records(category, license_plate, limit, timeout, brand, model, date_from, date_to)
+        result = future.result(timeout=_remaining(g.deadline))
+    except ValueError as exc:
+        return json_response({"error": str(exc)}, 400)
     except RuntimeError as exc:
-        return Response(str(exc), status=502, mimetype="text/plain")
+        return json_response({"error": str(exc)}, 502)
+    except FutureTimeoutError:
+        future.cancel()
+        return json_response({"error": "RDW API request timed out."}, 504)
+    return json_response(result)
+
+
+@app.route("/admin/reload-token", methods=["POST"])
+def reload_token() -> Response:
+    """Re-read RDW_APP_TOKEN from the environment and .env file."""
+    admin_token = os.getenv("ADMIN_TOKEN")
+    supplied = request.headers.get("X-Admin-Token", "")
+    if not admin_token or not hmac.compare_digest(supplied, admin_token):
+        return json_response({"error": "Forbidden"}, 403)
 
-    def generate() -> str:
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=rdw.CSV_FIELDNAMES)
-        writer.writeheader()
-        yield output.getvalue()
-        output.seek(0)
-        output.truncate(0)
+    global APP_TOKEN
+    load_dotenv(override=True)
+    rdw.resolve_app_token.cache_clear()
+    APP_TOKEN = rdw.resolve_app_token()
+    return json_response({"app_token_set": bool(APP_TOKEN)})
 
-        for row in result["records"]:
-            writer.writerow({field: row.get(field, "") for field in rdw.CSV_FIELDNAMES})
-            yield output.getvalue()
-            output.seek(0)
-            output.truncate(0)
 
+class _Echo:
+    """File-like sink that hands back whatever csv.writer writes to it."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+@lru_cache(maxsize=256)
+def _csv_filename(category: str, license_plate: str) -> str:
     filename_parts = ["rdw_data"]
     if category:
         filename_parts.append(category.lower().replace(" ", "_"))
     if license_plate:
         filename_parts.append(license_plate.replace(" ", "").replace("-", "").upper())
-    filename = "-".join(filename_parts) + ".csv"
+    return "-".join(filename_parts) + ".csv"
+
 
-    headers = {"Content-Disposition": f"attachment; filename={filename}"}
+@app.route("/download.csv")
+def download_csv() -> Response:
+    category = request.args.get("category", "")
+    license_plate = request.args.get("license_plate", "")
+    brand = request.args.get("brand", "")
+    model = request.args.get("model", "")
+    limit = parse_limit(request.args.get("limit"))
+    timeout = g.timeout
+    date_from = request.args.get("date_from", "")
+    date_to = request.args.get("date_to", "")
+
+    records = query_records_stream(category, license_plate, limit, timeout, brand, model, date_from, date_to, parallel=True)
+    # Pull the first record up front so upstream errors still become a 502
+    # instead of a truncated 200 download
+    try:
+        first = next(records, None)
+    except ValueError as exc:
+        return Response(str(exc), status=400, mimetype="text/plain")
+    except RuntimeError as exc:
+        return Response(str(exc), status=502, mimetype="text/plain")
+
+    def generate() -> Iterator[str]:
+        writer = csv.writer(_Echo())
+        fieldnames = rdw.CSV_FIELDNAMES
+        yield writer.writerow(fieldnames)
+
+        if first is None:
+            return
+        # Hand the server a few large chunks instead of one write per row
+        chunk: List[str] = []
+        size = 0
+        for row in chain([first], records):
+            get = row.get
+            line = writer.writerow([get(field, "") for field in fieldnames])
+            chunk.append(line)
+            size += len(line)
+            if len(chunk) >= CSV_CHUNK_ROWS or size >= CSV_CHUNK_BYTES:
+                yield "".join(chunk)
+                chunk.clear()
+                size = 0
+        if chunk:
+            yield "".join(chunk)
+
+    headers = {"Content-Disposition": f"attachment; filename={_csv_filename(category, license_plate)}"}
     return Response(stream_with_context(generate()), mimetype="text/csv", headers=headers)
 
 
@@ -215,4 +590,17 @@ def not_found(_: Exception) -> Response:
 
 
 if __name__ == "__main__":
-    app.run(debug=True, port=5001)
+    # CSV downloads stream for as long as RDW keeps paging, so serve with a
+    # threaded WSGI server; under gunicorn use e.g.
+    # `gunicorn -k gthread -w 4 --threads 8 web_app:app` instead.
+    # FLASK_DEV=1 keeps the reloading debug server for local work.
+    # Only localhost is served unless HOST says otherwise (e.g. HOST=0.0.0.0
+    # behind a proxy, after setting a real secret key and ADMIN_TOKEN).
+    host = os.getenv("HOST", "127.0.0.1")
+    if DEV_MODE:
+        app.run(debug=True, host=host, port=5001)
+    elif serve is not None:
+        serve(app, host=host, port=5001, threads=16, connection_limit=200)
+    else:
+        print("waitress is not installed; falling back to the threaded Flask server.", file=sys.stderr)
+        app.run(host=host, port=5001, threaded=True)